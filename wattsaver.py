@@ -6,18 +6,28 @@ or acpi-cpufreq driver. Provides power profiles, undervolt presets, GPU
 switching, and live CPU monitoring from the GNOME top bar.
 """
 
+import ctypes
+import ctypes.util
 import glob
 import os
 import re
+import shutil
 import subprocess
 import signal
 import sys
+import threading
+import time
 
 import gi
 gi.require_version("Gtk", "3.0")
 gi.require_version("AyatanaAppIndicator3", "0.1")
 from gi.repository import Gtk, GLib, AyatanaAppIndicator3
 
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
 # ── Paths ─────────────────────────────────────────────────────────────
 
 HELPER_PATHS = [
@@ -29,7 +39,14 @@ SYSFS_CPU_BASE = "/sys/devices/system/cpu"
 SYSFS_HWMON = "/sys/class/hwmon"
 
 GPU_MODES = ["integrated", "hybrid", "nvidia"]
-REFRESH_INTERVAL_MS = 2500
+REFRESH_INTERVAL_S = 3
+REFRESH_IDLE_INTERVAL_S = 5   # used once the frequency reading is stable
+MAX_SAMPLED_CPUS = 8
+
+_GHZ_RE = re.compile(r"@\s*([\d.]+)\s*GHz").search
+_UNDERVOLT_CPU_RE = re.compile(
+    rb"^[ \t]*undervolt[ \t]+\S+[ \t]+'CPU'[ \t]+(-?\d+(?:\.\d+)?)", re.MULTILINE
+).search
 
 UNDERVOLT_PRESETS = [
     {"key": "none",       "label": "None (0 mV)",          "offset": 0},
@@ -37,6 +54,7 @@ UNDERVOLT_PRESETS = [
     {"key": "medium",     "label": "Medium (-100 mV)",      "offset": -100},
     {"key": "aggressive", "label": "Aggressive (-125 mV)",  "offset": -125},
 ]
+UNDERVOLT_OFFSETS = {p["key"]: p["offset"] for p in UNDERVOLT_PRESETS}
 
 
 # ── Utility functions ─────────────────────────────────────────────────
@@ -51,18 +69,31 @@ def read_sysfs(path):
 
 def read_sysfs_int(path):
     val = read_sysfs(path)
-    if val and val.lstrip("-").isdigit():
+    if val is None:
+        return None
+    try:
         return int(val)
-    return None
+    except ValueError:
+        return None
 
 
-def has_command(name):
+def open_sysfs_fd(path):
+    try:
+        return os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return None
+
+
+def _pread_int(fd):
+    """Re-read an integer sysfs attribute from an already open fd."""
     try:
-        return subprocess.run(
-            ["which", name], capture_output=True
-        ).returncode == 0
-    except Exception:
-        return False
+        return int(os.pread(fd, 24, 0))
+    except (OSError, ValueError):
+        return None
+
+
+def has_command(name):
+    return shutil.which(name) is not None
 
 
 def find_helper():
@@ -72,24 +103,6 @@ def find_helper():
     return None
 
 
-def run_helper(command, *args):
-    helper = find_helper()
-    if not helper:
-        return False, "Helper script not found"
-    cmd = ["pkexec", helper, command] + [str(a) for a in args]
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return True, result.stdout.strip()
-        if result.returncode == 126:
-            return False, "Authentication dismissed"
-        return False, result.stderr.strip() or result.stdout.strip()
-    except subprocess.TimeoutExpired:
-        return False, "Operation timed out"
-    except Exception as e:
-        return False, str(e)
-
-
 # ── CPU detection ─────────────────────────────────────────────────────
 
 class CPUInfo:
@@ -112,21 +125,42 @@ class CPUInfo:
         # Base frequency — try to read from sysfs, fall back to heuristic
         self.base_khz = self._detect_base_freq()
 
-        # Count online CPUs
-        self.online_cpus = self._count_online_cpus()
+        # Count online CPUs and cache the frequency paths to sample;
+        # the topology is static, so the sensor poll never rescans sysfs
+        cpu_indices = self._scan_cpus()
+        if cpu_indices is None:
+            # sysfs unreadable: guess the count, but there is nothing to poll
+            cpu_indices = []
+            self.online_cpus = os.cpu_count() or 4
+        else:
+            self.online_cpus = len(cpu_indices)
+
+        # The displayed average only needs a few cores: sample one logical
+        # CPU per physical core, capped at MAX_SAMPLED_CPUS
+        self.sample_cpu_paths = tuple(
+            f"{SYSFS_CPU_BASE}/cpu{i}/cpufreq/scaling_cur_freq"
+            for i in self._physical_cores(cpu_indices)[:MAX_SAMPLED_CPUS]
+        )
+
+        # Temperature sensor path, resolved once
+        self.temp_input_path = self._find_temp_input()
 
         # Available governors
         self.governors = self._read_governors()
 
     def _read_model(self):
+        # One read and a substring search; the first entry is all we need
         try:
             with open("/proc/cpuinfo") as f:
-                for line in f:
-                    if line.startswith("model name"):
-                        return line.split(":", 1)[1].strip()
+                data = f.read()
         except (OSError, IOError):
-            pass
-        return "Unknown CPU"
+            return "Unknown CPU"
+        start = data.find("model name")
+        if start < 0:
+            return "Unknown CPU"
+        end = data.find("\n", start)
+        line = data[start:end] if end >= 0 else data[start:]
+        return line.partition(":")[2].strip() or "Unknown CPU"
 
     def _detect_base_freq(self):
         # Method 1: base_frequency sysfs (available on some kernels)
@@ -135,24 +169,51 @@ class CPUInfo:
             return val
 
         # Method 2: parse from CPU model string (e.g. "@ 2.40GHz")
-        match = re.search(r"@\s*([\d.]+)\s*GHz", self.model)
+        match = _GHZ_RE(self.model)
         if match:
             return int(float(match.group(1)) * 1_000_000)
 
         # Method 3: midpoint between min and max
         return (self.hw_min_khz + self.hw_max_khz) // 2
 
-    def _count_online_cpus(self):
-        count = 0
+    def _scan_cpus(self):
+        """Return the sorted indices of CPUs that expose cpufreq.
+
+        Returns None if the CPU directory cannot be listed at all.
+        """
+        indices = []
         try:
-            for entry in os.listdir(SYSFS_CPU_BASE):
-                if re.match(r"cpu\d+$", entry):
-                    cpufreq = f"{SYSFS_CPU_BASE}/{entry}/cpufreq"
-                    if os.path.isdir(cpufreq):
-                        count += 1
+            with os.scandir(SYSFS_CPU_BASE) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("cpu") and name[3:].isdigit():
+                        if os.path.isdir(f"{entry.path}/cpufreq"):
+                            indices.append(int(name[3:]))
         except OSError:
-            count = os.cpu_count() or 4
-        return count
+            return None
+        return sorted(indices)
+
+    def _physical_cores(self, cpu_indices):
+        """Keep only the first SMT sibling of each physical core."""
+        cores = []
+        for i in cpu_indices:
+            siblings = read_sysfs(
+                f"{SYSFS_CPU_BASE}/cpu{i}/topology/thread_siblings_list"
+            )
+            # e.g. "0,4" or "0-1"; unreadable topology keeps the CPU
+            first = siblings.replace("-", ",").split(",")[0] if siblings else ""
+            if not first.isdigit() or int(first) == i:
+                cores.append(i)
+        return cores
+
+    def _find_temp_input(self):
+        # Try coretemp (Intel), then k10temp (AMD), then thermal_zone fallback
+        for name_path in sorted(glob.glob(f"{SYSFS_HWMON}/hwmon*/name")):
+            if read_sysfs(name_path) in ("coretemp", "k10temp"):
+                path = os.path.join(os.path.dirname(name_path), "temp1_input")
+                if os.path.isfile(path):
+                    return path
+        return "/sys/class/thermal/thermal_zone0/temp"
 
     def _read_governors(self):
         val = read_sysfs(
@@ -180,49 +241,35 @@ class CPUInfo:
         base = self.base_khz
         span = hi - lo
 
-        profiles = [
-            {
-                "key": "powersaver",
-                "label": f"Power Saver ({self._fmt_ghz(lo)})",
-                "freq_khz": lo,
-                "icon": "power-profile-power-saver-symbolic",
-            },
-            {
-                "key": "low",
-                "label": f"Low ({self._fmt_ghz(lo + span // 4)})",
-                "freq_khz": lo + span // 4,
-                "icon": "power-profile-power-saver-symbolic",
-            },
-            {
-                "key": "balanced",
-                "label": f"Balanced ({self._fmt_ghz(base)})",
-                "freq_khz": base,
-                "icon": "power-profile-balanced-symbolic",
-            },
-            {
-                "key": "high",
-                "label": f"High ({self._fmt_ghz(lo + 3 * span // 4)})",
-                "freq_khz": lo + 3 * span // 4,
-                "icon": "power-profile-performance-symbolic",
-            },
-            {
-                "key": "performance",
-                "label": f"Performance ({self._fmt_ghz(hi)})",
-                "freq_khz": hi,
-                "icon": "power-profile-performance-symbolic",
-            },
-        ]
+        candidates = (
+            ("powersaver", "Power Saver", lo,
+             "power-profile-power-saver-symbolic"),
+            ("low", "Low", lo + span // 4,
+             "power-profile-power-saver-symbolic"),
+            ("balanced", "Balanced", base,
+             "power-profile-balanced-symbolic"),
+            ("high", "High", lo + 3 * span // 4,
+             "power-profile-performance-symbolic"),
+            ("performance", "Performance", hi,
+             "power-profile-performance-symbolic"),
+        )
 
-        # Deduplicate profiles that ended up at the same frequency
+        # Skip profiles that end up at the same frequency, rounded to the
+        # nearest 100 MHz to avoid near-duplicates
         seen = set()
-        unique = []
-        for p in profiles:
-            # Round to nearest 100 MHz to avoid near-duplicates
-            bucket = round(p["freq_khz"] / 100000)
-            if bucket not in seen:
-                seen.add(bucket)
-                unique.append(p)
-        return unique
+        profiles = []
+        for key, name, freq_khz, icon in candidates:
+            bucket = (freq_khz + 50000) // 100000
+            if bucket in seen:
+                continue
+            seen.add(bucket)
+            profiles.append({
+                "key": key,
+                "label": f"{name} ({self._fmt_ghz(freq_khz)})",
+                "freq_khz": freq_khz,
+                "icon": icon,
+            })
+        return profiles
 
     @staticmethod
     def _fmt_ghz(khz):
@@ -232,6 +279,173 @@ class CPUInfo:
         return f"{ghz:.2f} GHz"
 
 
+# ── Sensor sampling ───────────────────────────────────────────────────
+
+CLOCK_MONOTONIC = 1
+TFD_CLOEXEC = os.O_CLOEXEC
+TFD_TIMER_ABSTIME = 1
+
+_libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+
+def _glib_timer_perturb():
+    """Microsecond offset GLib gives every seconds-granularity timeout.
+
+    Mirrors gmain.c: g_str_hash() of the session bus address (or HOSTNAME)
+    modulo one second, so all such timers in the session wake together.
+    """
+    key = os.environ.get("DBUS_SESSION_BUS_ADDRESS")
+    if key is None:
+        key = os.environ.get("HOSTNAME")
+    if key is None:
+        return 0
+    h = 5381
+    for c in key.encode():
+        h = (h * 33 + (c - 256 if c > 127 else c)) & 0xFFFFFFFF
+    if h >= 0x80000000:
+        h -= 0x100000000
+    return abs(h) % 1_000_000
+
+
+def _coalesced_expiration_us(delay_s):
+    """Absolute CLOCK_MONOTONIC time (us) GLib would pick for delay_s.
+
+    Same rounding as g_timeout_add_seconds(): land on the session's
+    perturbation mark within the second, never more than 1/4 s early.
+    """
+    perturb = _glib_timer_perturb()
+    expiration = time.clock_gettime_ns(time.CLOCK_MONOTONIC) // 1000
+    expiration += delay_s * 1_000_000 - perturb
+    remainder = expiration % 1_000_000
+    if remainder >= 1_000_000 // 4:
+        expiration += 1_000_000
+    return expiration - remainder + perturb
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+def _kernel_version():
+    match = re.match(r"(\d+)\.(\d+)", os.uname().release)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+class UringReader:
+    """Read a fixed set of integer sysfs fds with one io_uring submission.
+
+    Queues an IORING_OP_READ per fd into its own small buffer and submits
+    them together, replacing N read syscalls with a single io_uring_enter.
+    Requires the optional ``liburing`` module and Linux 5.6+.
+    """
+
+    def __init__(self, fds):
+        if _kernel_version() < (5, 6):
+            raise OSError("IORING_OP_READ requires Linux 5.6 or newer")
+        self._fds = fds
+        self._bufs = [bytearray(24) for _ in fds]
+        self._ring_ready = False
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(max(len(fds), 1), self._ring)
+        self._ring_ready = True
+
+    def read_total(self):
+        """Return (sum, count) over the fds that read successfully."""
+        ring = self._ring
+        for i, fd in enumerate(self._fds):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, self._bufs[i], 0)
+            liburing.io_uring_sqe_set_data64(sqe, i)
+        liburing.io_uring_submit_and_wait(ring, len(self._fds))
+
+        # Harvest one completion at a time: the binding's cqe[i] does not
+        # follow the CQ ring across a wrap, cqe[0] always does
+        total = 0
+        count = 0
+        for _ in self._fds:
+            liburing.io_uring_wait_cqe(ring, self._cqe)
+            cqe = self._cqe[0]
+            res, slot = cqe.res, cqe.user_data
+            liburing.io_uring_cq_advance(ring, 1)
+            if res > 0:
+                total += int(self._bufs[slot][:res])
+                count += 1
+        return total, count
+
+    def close(self):
+        if self._ring_ready:
+            self._ring_ready = False
+            liburing.io_uring_queue_exit(self._ring)
+
+
+class SensorThread(threading.Thread):
+    """Sample sensors at a steady rate off the GTK main loop.
+
+    Each tick is driven by a CLOCK_MONOTONIC timerfd, so the rate does not
+    drift with the time spent reading, and ticks are placed where GLib
+    would put a timeout_add_seconds() source so wakeups still coalesce.
+    Results are handed to the main loop with GLib.idle_add(). While
+    disarmed the thread blocks in read() and causes no wakeups at all.
+    """
+
+    def __init__(self, sample, callback, interval_s):
+        super().__init__(name="wattsaver-sensors", daemon=True)
+        self._sample = sample
+        self._callback = callback
+        self.interval_s = interval_s
+        self._armed = False
+        self._tfd = _libc.timerfd_create(CLOCK_MONOTONIC, TFD_CLOEXEC)
+        if self._tfd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def _settime(self, value_sec, value_nsec, interval_sec, flags=0):
+        spec = _Itimerspec()
+        spec.it_interval.tv_sec = interval_sec
+        spec.it_value.tv_sec = value_sec
+        spec.it_value.tv_nsec = value_nsec
+        if _libc.timerfd_settime(self._tfd, flags, ctypes.byref(spec), None) < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def _settime_coalesced(self, delay_s):
+        # Whole-second periods starting on GLib's per-session mark keep
+        # every tick aligned with the session's timeout_add_seconds() timers
+        expiration = _coalesced_expiration_us(delay_s)
+        self._settime(
+            expiration // 1_000_000, expiration % 1_000_000 * 1000,
+            self.interval_s, TFD_TIMER_ABSTIME,
+        )
+
+    def arm(self):
+        """Sample at the next coalescing point, then every interval_s."""
+        self._armed = True
+        self._settime_coalesced(0)
+
+    def disarm(self):
+        self._armed = False
+        self._settime(0, 0, 0)
+
+    def set_interval(self, interval_s):
+        """Change the sampling period; the next tick is interval_s away."""
+        self.interval_s = interval_s
+        if self._armed:
+            self._settime_coalesced(interval_s)
+
+    def run(self):
+        while True:
+            try:
+                os.read(self._tfd, 8)
+            except OSError:
+                return
+            GLib.idle_add(self._callback, *self._sample())
+
+
 # ── Main application ──────────────────────────────────────────────────
 
 class WattSaver:
@@ -239,16 +453,48 @@ class WattSaver:
         # Detect hardware
         self.cpu = CPUInfo()
         self.profiles = self.cpu.build_profiles()
+        self._profile_by_key = {p["key"]: p for p in self.profiles}
         self.has_envycontrol = has_command("envycontrol")
         self.has_undervolt = has_command("intel-undervolt")
 
+        # Privileged helper and pkexec don't move at runtime; resolve once
+        self.helper = find_helper()
+        self.pkexec = shutil.which("pkexec")
+        if self.helper is None:
+            self.helper_error = "Helper script not found"
+        elif self.pkexec is None:
+            self.helper_error = "pkexec not found"
+        else:
+            self.helper_error = None
+
         # Detect current state
+        self._gpu_mode_cache = None
         self.current_profile_key = self._detect_profile()
         self.current_undervolt_key = self._detect_undervolt()
 
         self.profile_items = {}
         self.undervolt_items = {}
 
+        # Keep sensor files open so each poll is a single pread()
+        self._freq_fds = [
+            fd for fd in map(open_sysfs_fd, self.cpu.sample_cpu_paths)
+            if fd is not None
+        ]
+        self._temp_fd = open_sysfs_fd(self.cpu.temp_input_path)
+
+        # Batch the frequency reads through io_uring when available. The
+        # binding is optional and its API has changed between releases, so
+        # any setup failure just leaves the pread() path in place.
+        self._uring = None
+        if liburing is not None and self._freq_fds:
+            try:
+                self._uring = UringReader(self._freq_fds)
+            except Exception:
+                pass
+        # No explicit teardown: the sensor thread may be mid-read on these
+        # fds or the ring when the app quits, and process exit releases
+        # both anyway
+
         # Create indicator
         current = self._get_profile(self.current_profile_key)
         icon = current["icon"] if current else "power-profile-balanced-symbolic"
@@ -263,15 +509,40 @@ class WattSaver:
         self._build_menu()
         self.indicator.set_menu(self.menu)
 
-        # Start sensor polling
-        self._update_sensors()
-        GLib.timeout_add(REFRESH_INTERVAL_MS, self._update_sensors)
+        # Sampling runs on its own thread so sysfs reads never stall the UI.
+        # The indicator exports the menu over dbusmenu and the panel draws
+        # it, so the local Gtk.Menu's show/hide signals may never fire.
+        # Poll from startup, and only gate polling on menu visibility once
+        # a "show" has actually been seen.
+        self.sensor_thread = SensorThread(
+            self._sample_sensors, self._apply_sensor_update, REFRESH_INTERVAL_S
+        )
+        self.sensor_thread.start()
+        self._ema_mhz = None
+        self._stable_ticks = 0
+        self._menu_signals_seen = False
+        self.menu.connect("show", self._on_menu_show)
+        self.menu.connect("hide", self._on_menu_hide)
+        self.sensor_thread.arm()
 
     def _get_profile(self, key):
-        for p in self.profiles:
-            if p["key"] == key:
-                return p
-        return None
+        return self._profile_by_key.get(key)
+
+    def _run_helper(self, command, *args):
+        if self.helper_error:
+            return False, self.helper_error
+        cmd = [self.pkexec, self.helper, command] + [str(a) for a in args]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                return True, result.stdout.strip()
+            if result.returncode == 126:
+                return False, "Authentication dismissed"
+            return False, result.stderr.strip() or result.stdout.strip()
+        except subprocess.TimeoutExpired:
+            return False, "Operation timed out"
+        except Exception as e:
+            return False, str(e)
 
     # ── Menu construction ─────────────────────────────────────────────
 
@@ -287,6 +558,15 @@ class WattSaver:
         driver_label.set_sensitive(False)
         self.menu.append(driver_label)
 
+        # Without the helper none of the controls below can work
+        can_control = self.helper_error is None
+        if not can_control:
+            warning = Gtk.MenuItem(
+                label=f"{self.helper_error} — controls disabled"
+            )
+            warning.set_sensitive(False)
+            self.menu.append(warning)
+
         self.menu.append(Gtk.SeparatorMenuItem())
 
         # Live monitoring
@@ -316,12 +596,14 @@ class WattSaver:
             if key == self.current_profile_key:
                 item.set_active(True)
             item.connect("toggled", self._on_profile_toggled, key)
+            item.set_sensitive(can_control)
             self.profile_items[key] = item
             self.menu.append(item)
 
         # Custom frequency option
         custom_item = Gtk.MenuItem(label="Custom frequency...")
         custom_item.connect("activate", self._on_custom_freq)
+        custom_item.set_sensitive(can_control)
         self.menu.append(custom_item)
 
         self.menu.append(Gtk.SeparatorMenuItem())
@@ -343,12 +625,14 @@ class WattSaver:
                 if key == self.current_undervolt_key:
                     item.set_active(True)
                 item.connect("toggled", self._on_undervolt_toggled, key)
+                item.set_sensitive(can_control)
                 self.undervolt_items[key] = item
                 self.menu.append(item)
 
             # Custom undervolt option
             custom_uv = Gtk.MenuItem(label="Custom undervolt...")
             custom_uv.connect("activate", self._on_custom_undervolt)
+            custom_uv.set_sensitive(can_control)
             self.menu.append(custom_uv)
 
             self.menu.append(Gtk.SeparatorMenuItem())
@@ -358,6 +642,7 @@ class WattSaver:
             gpu_mode = self._detect_gpu_mode()
             self.gpu_item = Gtk.MenuItem(label=f"GPU: {gpu_mode}")
             self.gpu_item.set_submenu(self._build_gpu_submenu())
+            self.gpu_item.set_sensitive(can_control)
             self.menu.append(self.gpu_item)
             self.menu.append(Gtk.SeparatorMenuItem())
 
@@ -379,52 +664,97 @@ class WattSaver:
 
     # ── Sensor polling ────────────────────────────────────────────────
 
-    def _update_sensors(self):
-        # Average frequency across all online cores
-        freqs = []
-        try:
-            for entry in sorted(os.listdir(SYSFS_CPU_BASE)):
-                if not re.match(r"cpu\d+$", entry):
-                    continue
-                val = read_sysfs_int(
-                    f"{SYSFS_CPU_BASE}/{entry}/cpufreq/scaling_cur_freq"
-                )
-                if val is not None:
-                    freqs.append(val)
-        except OSError:
-            pass
+    def _on_menu_show(self, _menu):
+        self._menu_signals_seen = True
+        self._ema_mhz = None
+        self._stable_ticks = 0
+        self.sensor_thread.set_interval(REFRESH_INTERVAL_S)
+        self.sensor_thread.arm()
+
+    def _on_menu_hide(self, _menu):
+        # A hide without a prior show would stop updates for good
+        if self._menu_signals_seen:
+            self.sensor_thread.disarm()
 
-        if freqs:
-            avg_mhz = sum(freqs) / len(freqs) / 1000
-            self.freq_item.set_label(f"CPU: {avg_mhz:.0f} MHz  ({len(freqs)} cores)")
+    def _sample_sensors(self):
+        """Read sensors; runs on the sensor thread, never touches widgets."""
+        # Average frequency across all online cores
+        total, count = self._read_freq_total()
+        avg_mhz = total // (count * 1000) if count else None
+
+        return avg_mhz, count, self._read_cpu_temp()
+
+    def _read_freq_total(self):
+        if self._uring is not None:
+            try:
+                return self._uring.read_total()
+            except Exception:
+                # Any failure in the binding (not just OSError) must not
+                # kill the sensor thread; use plain pread() from now on
+                uring, self._uring = self._uring, None
+                try:
+                    uring.close()
+                except Exception:
+                    pass
+
+        total = 0
+        count = 0
+        for fd in self._freq_fds:
+            val = _pread_int(fd)
+            if val is not None:
+                total += val
+                count += 1
+        return total, count
+
+    def _apply_sensor_update(self, avg_mhz, n_cores, temp_c):
+        if avg_mhz is not None:
+            self._smooth_freq(avg_mhz)
+            total_cores = self.cpu.online_cpus
+            if n_cores < total_cores:
+                cores = f"sampled {n_cores}/{total_cores} cores"
+            else:
+                cores = f"{n_cores} cores"
+            self.freq_item.set_label(
+                f"CPU: {self._ema_mhz:.0f} MHz  ({cores})"
+            )
         else:
             self.freq_item.set_label("CPU: N/A")
 
-        # Temperature
-        temp = self._read_cpu_temp()
-        if temp is not None:
-            self.temp_item.set_label(f"Temp: {temp:.0f} °C")
+        if temp_c is not None:
+            self.temp_item.set_label(f"Temp: {temp_c:.0f} °C")
         else:
             self.temp_item.set_label("Temp: N/A")
 
-        return True
+        return GLib.SOURCE_REMOVE
 
-    def _read_cpu_temp(self):
-        # Try coretemp (Intel), then k10temp (AMD), then thermal_zone fallback
-        try:
-            for hwmon in os.listdir(SYSFS_HWMON):
-                name = read_sysfs(os.path.join(SYSFS_HWMON, hwmon, "name"))
-                if name in ("coretemp", "k10temp"):
-                    val = read_sysfs_int(
-                        os.path.join(SYSFS_HWMON, hwmon, "temp1_input")
-                    )
-                    if val is not None:
-                        return val / 1000
-        except OSError:
-            pass
+    def _smooth_freq(self, avg_mhz):
+        """Fold a sample into the displayed EMA and adapt the poll rate.
+
+        After three consecutive samples within 5% of the average, back off
+        to REFRESH_IDLE_INTERVAL_S; a jump of more than 10% restores the
+        normal rate.
+        """
+        if self._ema_mhz is None:
+            self._ema_mhz = avg_mhz
+            return
+        self._ema_mhz = 0.3 * avg_mhz + 0.7 * self._ema_mhz
+        delta = abs(avg_mhz - self._ema_mhz) / self._ema_mhz
+
+        thread = self.sensor_thread
+        if delta < 0.05:
+            self._stable_ticks += 1
+            if (self._stable_ticks >= 3
+                    and thread.interval_s != REFRESH_IDLE_INTERVAL_S):
+                thread.set_interval(REFRESH_IDLE_INTERVAL_S)
+        else:
+            self._stable_ticks = 0
+            if delta > 0.10 and thread.interval_s != REFRESH_INTERVAL_S:
+                thread.set_interval(REFRESH_INTERVAL_S)
 
-        # Fallback: thermal_zone0
-        val = read_sysfs_int("/sys/class/thermal/thermal_zone0/temp")
+    def _read_cpu_temp(self):
+        if self._temp_fd is None:
+            return None
+        val = _pread_int(self._temp_fd)
         if val is not None:
             return val / 1000
         return None
@@ -450,33 +780,39 @@ class WattSaver:
 
     def _detect_undervolt(self):
         try:
-            with open("/etc/intel-undervolt.conf") as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("undervolt") and "'CPU'" in line and "Cache" not in line:
-                        parts = line.split()
-                        offset = int(float(parts[-1]))
-                        if offset == 0:
-                            return "none"
-                        elif offset >= -50:
-                            return "light"
-                        elif offset >= -100:
-                            return "medium"
-                        else:
-                            return "aggressive"
-        except (OSError, IOError, ValueError, IndexError):
-            pass
-        return "none"
+            with open("/etc/intel-undervolt.conf", "rb") as f:
+                data = f.read()
+        except (OSError, IOError):
+            return "none"
+
+        # The 'CPU' plane only; 'CPU Cache' does not match the quoted name
+        match = _UNDERVOLT_CPU_RE(data)
+        if not match:
+            return "none"
+        offset = int(float(match.group(1)))
+        if offset == 0:
+            return "none"
+        elif offset >= -50:
+            return "light"
+        elif offset >= -100:
+            return "medium"
+        else:
+            return "aggressive"
 
     def _detect_gpu_mode(self):
+        # Only a successful switch changes the mode, so query envycontrol
+        # once and keep the answer until then
+        if self._gpu_mode_cache is not None:
+            return self._gpu_mode_cache
         try:
             result = subprocess.run(
                 ["envycontrol", "--query"],
-                capture_output=True, text=True, timeout=5,
+                capture_output=True, timeout=5,
             )
             output = result.stdout.strip().lower()
             for mode in GPU_MODES:
-                if mode in output:
+                if mode.encode() in output:
+                    self._gpu_mode_cache = mode
                     return mode
         except Exception:
             pass
@@ -494,7 +830,7 @@ class WattSaver:
         if not profile:
             return
 
-        ok, msg = run_helper("set-freq", str(profile["freq_khz"]))
+        ok, msg = self._run_helper("set-freq", str(profile["freq_khz"]))
         if ok:
             self.current_profile_key = profile_key
             self.indicator.set_icon_full(profile["icon"], profile["label"])
@@ -548,7 +884,7 @@ class WattSaver:
             return
 
         freq_khz = int(freq_ghz * 1_000_000)
-        ok, msg = run_helper("set-freq", str(freq_khz))
+        ok, msg = self._run_helper("set-freq", str(freq_khz))
         if ok:
             self.current_profile_key = "__custom__"
             self.indicator.set_icon_full(
@@ -569,14 +905,11 @@ class WattSaver:
         if preset_key == self.current_undervolt_key:
             return
 
-        for preset in UNDERVOLT_PRESETS:
-            if preset["key"] == preset_key:
-                offset = preset["offset"]
-                break
-        else:
+        offset = UNDERVOLT_OFFSETS.get(preset_key)
+        if offset is None:
             return
 
-        ok, msg = run_helper("set-undervolt", str(offset))
+        ok, msg = self._run_helper("set-undervolt", str(offset))
         if ok:
             self.current_undervolt_key = preset_key
         else:
@@ -622,7 +955,7 @@ class WattSaver:
         if response != Gtk.ResponseType.OK:
             return
 
-        ok, msg = run_helper("set-undervolt", str(offset))
+        ok, msg = self._run_helper("set-undervolt", str(offset))
         if ok:
             self.current_undervolt_key = "__custom__"
             for item in self.undervolt_items.values():
@@ -651,8 +984,9 @@ class WattSaver:
         if response != Gtk.ResponseType.OK:
             return
 
-        ok, msg = run_helper("set-gpu", mode)
+        ok, msg = self._run_helper("set-gpu", mode)
         if ok:
+            self._gpu_mode_cache = None
             self.gpu_item.set_label(f"GPU: {mode}")
             self._show_info("GPU Mode Changed", f"Switched to {mode}. Please reboot.")
         else: